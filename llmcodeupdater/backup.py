@@ -1,13 +1,55 @@
 
+import errno
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+
+def _copy_one(file_path: str, backup_path: str, st: os.stat_result) -> None:
+    """Snapshot a single file into the backup tree using a pre-fetched stat.
+
+    Tries a hardlink first: one metadata operation, no bytes moved, and
+    safe because updates replace files via os.replace (a new inode), so
+    the linked backup keeps the original content untouched. Falls back
+    to a real copy across devices or where linking is not permitted,
+    using os.copy_file_range where available so the kernel moves the
+    bytes directly (a reflink on CoW filesystems, no user-space buffers
+    elsewhere). Size, mode and timestamps all come from the caller's
+    stat result, so the copy adds no metadata syscalls of its own.
+    Parent directories must already exist.
+    """
+    try:
+        os.link(file_path, backup_path)
+        # The link shares the source inode, so mode and times are
+        # already right.
+        return
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.EMLINK):
+            raise
+    with open(file_path, 'rb') as src, open(backup_path, 'wb') as dst:
+        size = st.st_size
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except (AttributeError, OSError):
+            # Not Linux, cross-device, or unsupported filesystem
+            src.seek(copied)
+            shutil.copyfileobj(src, dst)
+    os.chmod(backup_path, st.st_mode)
+    os.utime(backup_path, ns=(st.st_atime_ns, st.st_mtime_ns))
 
 def backup_files(file_paths: List[str], project_root: str, backup_root: str) -> int:
     """
     Creates backups of the specified files, preserving directory structure, and handles errors gracefully.
 
+    Copies run concurrently on a thread pool since each copy is I/O-bound;
+    overlapping the syscalls hides per-copy latency on many small files.
+
     Args:
         file_paths (List[str]): List of absolute file paths to back up.
         project_root (str): Root directory of the project.
@@ -21,16 +63,33 @@ def backup_files(file_paths: List[str], project_root: str, backup_root: str) ->
     backup_dir = os.path.join(backup_root, timestamp)
 
     try:
+        # Pre-compute (src, dst, stat) triples, skipping files that don't
+        # exist. The single stat here doubles as the existence check and
+        # feeds the copy, instead of exists + a second stat inside copy2.
+        pairs = []
         for file_path in file_paths:
-            if not os.path.exists(file_path):
-                # Skip if file doesn't exist
+            try:
+                st = os.stat(file_path)
+            except OSError:
                 continue
-
             relative_path = os.path.relpath(file_path, project_root)
-            backup_path = os.path.join(backup_dir, relative_path)
-            os.makedirs(os.path.dirname(backup_path), exist_ok=True)
-            shutil.copy2(file_path, backup_path)
-            files_backed_up += 1
+            pairs.append((file_path, os.path.join(backup_dir, relative_path), st))
+
+        # Create each unique parent directory once, shallowest first, so
+        # the copy workers never repeat the stat-per-component walk that
+        # makedirs performs for every call.
+        parent_dirs = {os.path.dirname(dst) for _, dst, _ in pairs}
+        for directory in sorted(parent_dirs, key=lambda d: d.count(os.sep)):
+            os.makedirs(directory, exist_ok=True)
+
+        # Cap the pool by the batch size too: a handful of files should
+        # not pay for spinning up 32 idle threads.
+        max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(pairs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_copy_one, src, dst, st) for src, dst, st in pairs]
+            for future in as_completed(futures):
+                future.result()
+                files_backed_up += 1
 
         return files_backed_up
     except Exception as e:
@@ -38,4 +97,20 @@ def backup_files(file_paths: List[str], project_root: str, backup_root: str) ->
         if os.path.exists(backup_dir):
             shutil.rmtree(backup_dir)
         raise e
-    
\ No newline at end of file
+
+def latest_backup_timestamp(backup_root: str) -> Optional[str]:
+    """Return the name of the newest backup snapshot under backup_root.
+
+    Timestamp directory names sort lexicographically, so one scandir pass
+    tracking the maximum replaces listing and sorting the directory.
+    Returns None when no snapshot exists.
+    """
+    latest = None
+    try:
+        with os.scandir(backup_root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and (latest is None or entry.name > latest):
+                    latest = entry.name
+    except OSError:
+        return None
+    return latest
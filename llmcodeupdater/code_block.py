@@ -1,7 +1,7 @@
 # llmcodeupdater/code_block.py
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 
 @dataclass
 class CodeBlock:
@@ -37,4 +37,14 @@ class CodeBlock:
     @property
     def is_valid(self) -> bool:
         """Check if the code block is valid for processing"""
-        return bool(self.filename and self.content.strip())
\ No newline at end of file
+        return bool(self.filename and self.content.strip())
+
+def format_blocks_for_clipboard(blocks: Iterable["CodeBlock"]) -> str:
+    """Concatenate many blocks into one delimited clipboard payload.
+
+    pyperclip.copy spawns a clipboard subprocess per call, so copying
+    blocks one at a time costs tens of milliseconds each; callers should
+    build this combined payload and copy it once.
+    """
+    separator = "\n// " + "=" * 70 + "\n"
+    return separator.join(block.to_clipboard_format() for block in blocks)
@@ -1,5 +1,6 @@
 import os
 import fnmatch
+import re
 from typing import List, Set
 import logging
 import time
@@ -47,7 +48,8 @@ class IgnoreHandler:
             '.modal',
             '.cache'
         }
-        self._pattern_cache = {}  # Cache for fnmatch results
+        self._pattern_cache = {}  # Cache for match results
+        self._ignore_re = None
         self.load_ignore_patterns()
         
     def load_ignore_patterns(self) -> None:
@@ -71,31 +73,60 @@ class IgnoreHandler:
                 except Exception as e:
                     logger.error(f"Error loading {ignore_file}: {e}")
         
+        self._compile_patterns()
         logger.info(f"Pattern loading completed in {time.time() - start_time:.2f}s")
 
+    def _compile_patterns(self) -> None:
+        """Fuse all ignore patterns into one compiled regex.
+
+        One C-level match per path replaces a Python loop of fnmatch calls
+        (each of which is itself a cached regex match). Directory patterns
+        keep their prefix-match semantics via an extra escaped alternative.
+        """
+        literals = set()
+        suffixes = []
+        parts = []
+        for pattern in self.ignore_patterns:
+            if pattern.endswith('/**'):
+                parts.append(f'(?:{re.escape(pattern[:-3])}.*)')
+                parts.append(f'(?:{fnmatch.translate(pattern)})')
+            elif not any(ch in pattern for ch in '*?['):
+                # Plain name, e.g. '.git': exact-match via set membership.
+                literals.add(pattern)
+            elif pattern.startswith('*') and not any(ch in pattern[1:] for ch in '*?['):
+                # Pure suffix glob, e.g. '*.pyc': str.endswith beats regex.
+                suffixes.append(pattern[1:])
+            else:
+                parts.append(f'(?:{fnmatch.translate(pattern)})')
+        self._literal_names = literals
+        self._suffixes = tuple(suffixes)
+        self._ignore_re = re.compile('|'.join(parts)) if parts else None
+        # The match cache keys on the path alone, so results computed
+        # against the previous pattern set are stale now.
+        self._pattern_cache.clear()
+
     def _check_path_against_patterns(self, path: str, patterns: Set[str]) -> bool:
-        """Check if path matches any pattern using caching."""
-        cache_key = (path, tuple(sorted(patterns)))
-        if cache_key in self._pattern_cache:
-            return self._pattern_cache[cache_key]
-        
+        """Check if path matches any pattern using caching.
+
+        The patterns argument is retained for API compatibility; the set is
+        fixed after loading, so the path alone keys the cache and the fused
+        regex does the matching.
+        """
+        if path in self._pattern_cache:
+            return self._pattern_cache[path]
+
         # Normalize path separators
         path = path.replace('\\', '/')
-        
-        # Check if any pattern matches
-        for pattern in patterns:
-            # Handle directory patterns
-            if pattern.endswith('/**'):
-                base_pattern = pattern[:-3]
-                if path.startswith(base_pattern) or fnmatch.fnmatch(path, pattern):
-                    self._pattern_cache[cache_key] = True
-                    return True
-            elif fnmatch.fnmatch(path, pattern):
-                self._pattern_cache[cache_key] = True
-                return True
-        
-        self._pattern_cache[cache_key] = False
-        return False
+
+        # Cheapest checks first: set membership, then suffix endswith, and
+        # only then the fused regex for the remaining complex patterns.
+        result = (
+            path in self._literal_names
+            or (bool(self._suffixes) and path.endswith(self._suffixes))
+            or (self._ignore_re is not None and self._ignore_re.match(path) is not None)
+        )
+        self._pattern_cache[path] = result
+        return result
 
     def is_ignored(self, path: str) -> bool:
         """Check if the given path matches any of the ignore patterns."""
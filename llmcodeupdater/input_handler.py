@@ -1,8 +1,6 @@
 # llmcodeupdater/input_handler.py
 
 import os
-import pyperclip
-import inquirer
 import json
 from typing import Optional, Dict, Union
 from pathlib import Path
@@ -11,6 +9,25 @@ import time
 
 logger = logging.getLogger(__name__)
 
+def _read_text(path) -> str:
+    """Read a whole file as UTF-8 via raw os calls.
+
+    Sizes the read from fstat and decodes once, skipping pathlib's layered
+    open machinery — noticeable on multi-MB LLM transcripts.
+    """
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data.decode('utf-8')
+
 class InputHandler:
     """Handles various input methods for the LLM code updater."""
     
@@ -18,21 +35,45 @@ class InputHandler:
         """Initialize with default git projects path."""
         self.git_path = os.path.expanduser(default_git_path)
         self._performance_metrics = {}  # Added performance metrics attribute
+        self._projects_cache = None  # (mtime_ns, parsed projects)
+        self._git_projects_cache = None  # (mtime_ns, sorted project list)
+        self._dispatch_cache = {}  # arg shape -> specialized handler
     
     def get_git_projects(self) -> list[str]:
         """Get list of git projects in the default directory."""
         projects = []
+        mtime_ns = None
         try:
-            git_path = Path(self.git_path).expanduser()
-            for item in git_path.iterdir():
-                if item.is_dir() and (item / '.git').exists():
-                    projects.append(str(item))
+            # Re-scanning is pointless until the parent directory changes;
+            # its mtime bumps whenever a project is added or removed.
+            try:
+                mtime_ns = os.stat(self.git_path).st_mtime_ns
+            except OSError:
+                pass
+            if mtime_ns is not None and self._git_projects_cache and self._git_projects_cache[0] == mtime_ns:
+                return self._git_projects_cache[1]
+
+            # scandir's DirEntry answers is_dir from the directory read,
+            # leaving one .git existence check as the only stat per entry.
+            with os.scandir(self.git_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, '.git')):
+                        projects.append(entry.path)
         except Exception as e:
             logger.error(f"Error scanning git directory: {e}")
-        return sorted(projects)
+            return sorted(projects)
+
+        projects = sorted(projects)
+        if mtime_ns is not None:
+            self._git_projects_cache = (mtime_ns, projects)
+        return projects
     
     def select_project_interactive(self) -> Optional[str]:
         """Show interactive project selection dialog."""
+        # Deferred import: inquirer drags in curses and friends, which
+        # non-interactive runs (--project-path) never need.
+        import inquirer
+
         projects = self.get_git_projects()  # Use git projects instead of VS Code projects
         if not projects:
             logger.warning("No projects found.")
@@ -58,7 +99,15 @@ class InputHandler:
     def get_clipboard_content(self) -> Optional[str]:
         """Get content from clipboard."""
         try:
-            return pyperclip.paste()
+            # Import on first use and keep the resolved paste callable:
+            # pyperclip probes for a working backend at import time, and
+            # most CLI runs (content-file mode) never need it at all.
+            paste = self._paste
+        except AttributeError:
+            import pyperclip
+            paste = self._paste = pyperclip.paste
+        try:
+            return paste()
         except Exception as e:
             logger.error(f"Error getting clipboard content: {e}")
             return None
@@ -84,18 +133,29 @@ class InputHandler:
             if not os.path.exists(config_path):
                 logger.warning(f"Configuration path not found: {config_path}")
                 return []
-            
+
+            # Reuse the parsed list while the file is unchanged; the mtime
+            # stat is far cheaper than re-reading and re-parsing the JSON.
+            try:
+                mtime_ns = os.stat(config_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns is not None and self._projects_cache and self._projects_cache[0] == mtime_ns:
+                return self._projects_cache[1]
+
             # Load the JSON file and parse projects
             with open(config_path, 'r') as f:
                 projects_data = json.load(f)
-            
+
             # Extract enabled projects with proper path handling
             enabled_projects = [
                 {"name": p.get("name", "Unnamed Project"), "path": p.get("path") or p.get("rootPath")}
-                for p in projects_data 
+                for p in projects_data
                 if p.get("enabled", True) and (p.get("path") or p.get("rootPath"))
             ]
-            
+
+            if mtime_ns is not None:
+                self._projects_cache = (mtime_ns, enabled_projects)
             return enabled_projects
         
         except Exception as e:
@@ -105,32 +165,56 @@ class InputHandler:
     def process_input(self, args: Dict) -> Dict[str, Union[str, Path, None]]:
         """Process input from various sources based on provided arguments."""
         start_time = time.time()  # Start timing the process
-        
-        result = {
-            'project_path': None,
-            'llm_content': None
-        }
-        
-        # Handle project path
-        if args.get('project_path'):
-            result['project_path'] = self.validate_path(args['project_path'])
-        elif args.get('interactive', True):
-            result['project_path'] = self.select_project_interactive()
-        
-        # Handle LLM content
-        if args.get('content_file'):
-            content_path = self.validate_path(args['content_file'])
-            if content_path and content_path.is_file():
-                try:
-                    result['llm_content'] = content_path.read_text(encoding='utf-8')
-                except Exception as e:
-                    logger.error(f"Error reading content file: {e}")
-        elif args.get('use_clipboard', False):
-            result['llm_content'] = self.get_clipboard_content()
-        
+
+        # Specialize once per argument shape: batch runs repeat the same
+        # shape, so later calls skip the if/elif chain entirely.
+        key = (
+            bool(args.get('project_path')),
+            args.get('interactive', True),
+            bool(args.get('content_file')),
+            args.get('use_clipboard', False),
+        )
+        handler = self._dispatch_cache.get(key)
+        if handler is None:
+            handler = self._dispatch_cache[key] = self._build_dispatch(key)
+
+        result = handler(args)
+
         self._performance_metrics['process_input'] = time.time() - start_time  # Record performance metric
         return result
 
+    def _build_dispatch(self, key) -> callable:
+        """Compose a handler for one process_input argument shape."""
+        has_path, interactive, has_content_file, use_clipboard = key
+
+        # Handle project path
+        if has_path:
+            get_project = lambda args: self.validate_path(args['project_path'])
+        elif interactive:
+            get_project = lambda args: self.select_project_interactive()
+        else:
+            get_project = lambda args: None
+
+        # Handle LLM content
+        if has_content_file:
+            def get_content(args):
+                content_path = self.validate_path(args['content_file'])
+                if content_path and content_path.is_file():
+                    try:
+                        return _read_text(content_path)
+                    except Exception as e:
+                        logger.error(f"Error reading content file: {e}")
+                return None
+        elif use_clipboard:
+            get_content = lambda args: self.get_clipboard_content()
+        else:
+            get_content = lambda args: None
+
+        return lambda args: {
+            'project_path': get_project(args),
+            'llm_content': get_content(args)
+        }
+
 def setup_cli_parser():
     """Set up command line argument parser."""
     import argparse
@@ -1,15 +1,45 @@
+import mmap
 import os
+import sys
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import List, Tuple, Dict, Optional
 import logging
 from pathlib import Path
-import difflib
-from termcolor import colored
+from functools import lru_cache
 from dataclasses import dataclass
 import re
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Compiled once: preserve_imports runs the line match once per line of
+# every updated file, and even re's internal cache charges a dict lookup
+# per call for string patterns.
+_RX_IMPORT = re.compile(r'(?:import|from)\s+\w+')
+_RX_IMPORT_ANY = re.compile(r'^(?:import|from)\s+\w+', re.MULTILINE)
+
+# Directories that never hold update targets but dominate entry counts:
+# VCS metadata, bytecode caches, vendored deps, and this tool's own
+# backup/conversion output. Pruned before descent in the walkers below.
+_IGNORE_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', 'encoding_backups',
+    '.venv', 'venv', 'backups',
+})
+
+# Per-file diff output exists for a human watching the run. When stdout
+# is piped (CI, logs) or LCU_QUIET=1, skip it entirely — difflib is
+# O(n*m) and can take seconds on large rewrites, all for output nobody
+# reads. The summary logging is unaffected.
+_EMIT_DIFF = sys.stdout.isatty() and os.environ.get('LCU_QUIET') != '1'
+
+# Durability knob for the atomic writes below: LCU_FSYNC=1 forces the
+# data to disk before the rename, guaranteeing the new content survives
+# power loss. Off by default — the rename is already atomic against
+# crashes of this process, and fsync per file is the dominant cost on
+# dev machines.
+_FSYNC_WRITES = os.environ.get('LCU_FSYNC') == '1'
+
+@dataclass(frozen=True, slots=True)
 class FileUpdateInfo:
     """Information about file updates"""
     old_path: str
@@ -19,9 +49,129 @@ class FileUpdateInfo:
     old_lines: int
     new_lines: int
     percent_change: float
-    diff: str
 
-def find_file(project_root: str, filename: str) -> str:
+@lru_cache(maxsize=None)
+def normalize_filename(filename: str) -> str:
+    """
+    Normalize a filename for tolerant matching (lowercase, no spaces).
+
+    Memoized: the same basenames recur across every indexed file and every
+    parsed block, so allocation work drops to one per distinct name.
+    """
+    return filename.replace(' ', '_').lower()
+
+_LOOSE_STRIP = str.maketrans('', '', ' _-')
+
+@lru_cache(maxsize=None)
+def _loose_normalize(filename: str) -> str:
+    """Collapse case, spaces, underscores and hyphens for last-resort
+    matching, so e.g. Redis-Manager.py finds redis_manager.py."""
+    return filename.lower().translate(_LOOSE_STRIP)
+
+_UNSET = object()
+
+def _index_add(index: Dict[str, str], name: str, path: str) -> None:
+    """Register one file under its exact, normalized and loose keys.
+
+    Both fuzzy tiers live under NUL prefixes so they can never shadow a
+    real filename — otherwise a case/space variant indexed first would
+    capture updates meant for the exactly-named file. A fuzzy key
+    claimed by two distinct paths is poisoned to None: an ambiguous
+    match is worse than no match.
+    """
+    index.setdefault(name, path)
+    for key in ('\0n:' + normalize_filename(name), '\0l:' + _loose_normalize(name)):
+        existing = index.get(key, _UNSET)
+        if existing is _UNSET:
+            index[key] = path
+        elif existing is not None and existing != path:
+            index[key] = None
+
+def _index_lookup(index: Dict[str, str], name: str) -> str:
+    """Resolve a basename through the exact, normalized and loose keys."""
+    return (index.get(name)
+            or index.get('\0n:' + normalize_filename(name))
+            or index.get('\0l:' + _loose_normalize(name))
+            or "")
+
+def _build_file_index(project_root: str) -> Dict[str, str]:
+    """
+    Walk the project tree once and index files by basename.
+
+    On duplicate basenames the lexicographically first path wins — the
+    concurrent walk completes in a racy order, so insertion is deferred
+    until all results are in and applied in sorted order to keep
+    resolution stable across runs. Indexing once turns the per-update
+    tree walk in update_files into an O(1) dict lookup.
+
+    Args:
+        project_root (str): The root directory of the project
+
+    Returns:
+        Dict[str, str]: Mapping of basename to absolute file path
+    """
+    index: Dict[str, str] = {}
+
+    def scan(directory: str):
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # DirEntry answers is_dir/is_file from the directory
+                    # read itself, avoiding a stat per entry.
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _IGNORE_DIRS:
+                            continue
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((entry.name, entry.path))
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+        return files, subdirs
+
+    # Scan subdirectories concurrently; directory reads are I/O-bound and
+    # overlap well, especially on network filesystems.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    all_files: List[Tuple[str, str]] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan, project_root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                all_files.extend(files)
+                pending.update(executor.submit(scan, d) for d in subdirs)
+    # Insert in path order, not completion order, so first-wins ties on
+    # duplicate basenames resolve the same way on every run.
+    all_files.sort(key=lambda item: item[1])
+    for name, path in all_files:
+        _index_add(index, name, path)
+    return index
+
+def index_from_paths(paths: List[str]) -> Dict[str, str]:
+    """
+    Build a basename index from an already-collected list of file paths.
+
+    Callers that have walked the tree once (e.g. main's Python-file
+    collection) can index that list instead of letting update_files
+    re-traverse the project. First occurrence wins, as in
+    _build_file_index.
+
+    Args:
+        paths (List[str]): Absolute file paths
+
+    Returns:
+        Dict[str, str]: Mapping of basename to file path
+    """
+    index: Dict[str, str] = {}
+    for path in paths:
+        # rpartition is a single C call; os.path.basename layers fspath
+        # and split logic on top of the same operation.
+        _index_add(index, path.rpartition(os.sep)[2], path)
+    return index
+
+def find_file(project_root: str, filename: str, index: Optional[Dict[str, str]] = None) -> str:
     """
     Searches for a file within the project directory. Matches by basename unless
     filename contains path separators.
@@ -29,6 +179,9 @@ def find_file(project_root: str, filename: str) -> str:
     Args:
         project_root (str): The root directory of the project
         filename (str): Name of the file to find (can include path)
+        index (Optional[Dict[str, str]]): Pre-built basename index from
+            _build_file_index; callers resolving many names should build it
+            once and pass it in to skip the per-call tree walk
         
     Returns:
         str: Absolute path to the file if found, empty string otherwise
@@ -39,11 +192,16 @@ def find_file(project_root: str, filename: str) -> str:
             full_path = os.path.join(project_root, filename)
             return full_path if os.path.exists(full_path) else ""
             
-        # For other files, search by basename
-        target_name = os.path.basename(filename)
+        # For other files, search by basename. This branch only runs for
+        # separator-free names, so the basename is the filename itself.
+        target_name = filename
+        if index is not None:
+            return _index_lookup(index, target_name)
         matches = []
         
-        for root, _, files in os.walk(project_root):
+        for root, dirs, files in os.walk(project_root):
+            # Prune in place so os.walk never descends into them.
+            dirs[:] = [d for d in dirs if d not in _IGNORE_DIRS]
             if target_name in files:
                 matches.append(os.path.join(root, target_name))
                 
@@ -65,15 +223,23 @@ def preserve_imports(old_content: str, new_content: str) -> str:
     Returns:
         str: Modified content with preserved imports if needed
     """
+    # Fast path: LLM output almost always opens with its imports, so a
+    # bounded C-speed substring probe of the first 2 KB settles the
+    # common case before the regex runs.
+    if (new_content.startswith(('import ', 'from '))
+            or '\nimport ' in new_content[:2048]
+            or '\nfrom ' in new_content[:2048]):
+        return new_content
+
     # Check if new content has imports
-    if re.search(r'^(?:import|from)\s+\w+', new_content, re.MULTILINE):
+    if _RX_IMPORT_ANY.search(new_content):
         return new_content
         
     # Extract imports from old content
     import_lines = []
-    
+    match = _RX_IMPORT.match
     for line in old_content.splitlines():
-        if re.match(r'^(?:import|from)\s+\w+', line):
+        if match(line):
             import_lines.append(line)
             
     # Combine preserved imports with new content
@@ -83,50 +249,110 @@ def preserve_imports(old_content: str, new_content: str) -> str:
         
     return new_content
 
+# Threshold table for get_change_color; bisect picks the band in one
+# O(log n) probe instead of walking an if/elif cascade per file.
+_COLOR_THRESHOLDS = (70, 80, 90, 110, 140)
+_COLOR_NAMES = ('red', 'yellow', 'white', 'green', 'magenta', 'blue')
+
 def get_change_color(percent: float) -> str:
     """Get color based on percentage change."""
-    if percent <= 70:
-        return 'red'
-    elif percent <= 80:
-        return 'yellow'
-    elif percent <= 90:
-        return 'white'
-    elif percent <= 110:
-        return 'green'
-    elif percent <= 120:
-        return 'magenta'
-    elif percent <= 140:
-        return 'magenta'
-    else:
-        return 'blue'
+    return _COLOR_NAMES[bisect_left(_COLOR_THRESHOLDS, percent)]
+
+# Rendered bars memoized by (filled, width, color): only width+1 x 6
+# distinct bars exist per width, so repeated files hit the cache
+# instead of re-multiplying strings and re-wrapping ANSI codes.
+_BAR_CACHE: Dict[Tuple[int, int, str], str] = {}
 
 def format_size_bar(percent: float, width: int = 40) -> str:
     """Create a visual representation of size change."""
     filled = int((min(percent, 200) / 200) * width)
-    bar = '=' * filled + ' ' * (width - filled)
     color = get_change_color(percent)
-    return colored(f'[{bar}]', color)
-
-def create_diff(old_content: str, new_content: str) -> str:
-    """Create a colored diff between old and new content."""
-    diff = difflib.unified_diff(
-        old_content.splitlines(keepends=True),
-        new_content.splitlines(keepends=True),
-        lineterm=''
-    )
-    
-    result = []
+    key = (filled, width, color)
+    bar = _BAR_CACHE.get(key)
+    if bar is None:
+        # Deferred import: only the human-readable report path needs
+        # termcolor.
+        from termcolor import colored
+
+        bar = _BAR_CACHE[key] = colored(f'[{"=" * filled}{" " * (width - filled)}]', color)
+    return bar
+
+# ANSI escapes inlined once; termcolor.colored would re-derive them (and
+# allocate twice) for every diff line.
+_ANSI_GREEN = '\x1b[32m'
+_ANSI_RED = '\x1b[31m'
+_ANSI_BLUE = '\x1b[34m'
+_ANSI_RESET = '\x1b[0m'
+
+# Above this size difflib's SequenceMatcher — O(n*m) with interpreter
+# overhead per line — can stall for seconds on near-matching inputs;
+# the native diff(1) handles the same inputs in milliseconds.
+_NATIVE_DIFF_MIN_SIZE = 64 * 1024
+
+def _native_diff_lines(old_content: str, new_content: str):
+    """Run diff -u over temp copies, yielding its output lines.
+
+    Returns None when no diff binary is available so the caller can fall
+    back to difflib.
+    """
+    import subprocess
+    import tempfile
+
+    # Pin UTF-8 on both sides: the temp files and diff's output must not
+    # depend on the locale encoding, or non-ASCII content raises
+    # UnicodeEncodeError under a C locale.
+    with tempfile.NamedTemporaryFile('w', suffix='.old', delete=False,
+                                     encoding='utf-8') as fa, \
+            tempfile.NamedTemporaryFile('w', suffix='.new', delete=False,
+                                        encoding='utf-8') as fb:
+        fa.write(old_content)
+        fb.write(new_content)
+    try:
+        try:
+            proc = subprocess.run(
+                ['diff', '-u', '--', fa.name, fb.name],
+                capture_output=True, text=True, encoding='utf-8'
+            )
+        except (FileNotFoundError, OSError):
+            return None
+        # diff exits 0 (same), 1 (differ) or 2 (trouble).
+        if proc.returncode > 1:
+            return None
+        return proc.stdout.splitlines(keepends=True)
+    finally:
+        os.unlink(fa.name)
+        os.unlink(fb.name)
+
+def create_diff(old_content: str, new_content: str):
+    """Yield colored diff lines between old and new content.
+
+    A generator rather than a joined string: callers stream the lines to
+    stdout, so a large file's diff never has to be materialized alongside
+    both content copies. Large inputs are diffed by the native diff(1),
+    which sidesteps difflib's pathological cases.
+    """
+    diff = None
+    if max(len(old_content), len(new_content)) > _NATIVE_DIFF_MIN_SIZE:
+        diff = _native_diff_lines(old_content, new_content)
+    if diff is None:
+        # Deferred import: difflib (and its re/heapq baggage) only loads
+        # when a diff is actually produced.
+        import difflib
+
+        diff = difflib.unified_diff(
+            old_content.splitlines(keepends=True),
+            new_content.splitlines(keepends=True),
+            lineterm=''
+        )
     for line in diff:
         if line.startswith('+'):
-            result.append(colored(line, 'green'))
+            yield f"{_ANSI_GREEN}{line}{_ANSI_RESET}"
         elif line.startswith('-'):
-            result.append(colored(line, 'red'))
+            yield f"{_ANSI_RED}{line}{_ANSI_RESET}"
         elif line.startswith('^'):
-            result.append(colored(line, 'blue'))
+            yield f"{_ANSI_BLUE}{line}{_ANSI_RESET}"
         else:
-            result.append(line)
-            
-    return ''.join(result)
+            yield line
 
 def is_partial_update(old_content: str, new_content: str) -> bool:
     """
@@ -139,11 +365,122 @@ def is_partial_update(old_content: str, new_content: str) -> bool:
     Returns:
         bool: True if update is partial, False otherwise
     """
-    old_lines = set(old_content.splitlines())
-    new_lines = set(new_content.splitlines())
-    return bool(old_lines & new_lines)
+    # Hash only the smaller side and scan the larger with early exit:
+    # shared lines (imports, shebangs) usually appear near the top, so
+    # the typical positive answer costs a handful of lines, not two full
+    # sets.
+    if len(old_content) < len(new_content):
+        small, large = old_content, new_content
+    else:
+        small, large = new_content, old_content
+    seen = set(small.splitlines())
+    for line in large.splitlines():
+        if line in seen:
+            return True
+    return False
+
+# Below this size the mmap setup costs more than it saves; above it,
+# decoding straight out of the mapped pages skips the intermediate
+# bytes copy a plain read() makes.
+_MMAP_MIN_SIZE = 1 << 16
+
+def _read_text_and_size(file_path: str) -> Tuple[str, int, int]:
+    """Read a file as UTF-8, returning (content, byte size, st_mode).
+
+    Large files are memory-mapped and decoded directly from the page
+    cache — str() accepts the mmap buffer, so no bytes copy is made.
+    Small files take the plain read path, where mmap overhead would
+    dominate. The mode rides along from the fstat already taken for the
+    size, so the atomic rewrite can restore it without a second stat.
+    """
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        if size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, 'utf-8'), size, st.st_mode
+        data = f.read()
+        return data.decode('utf-8'), len(data), st.st_mode
+
+def _apply_update(file_path: str, code_block: str):
+    """Read, merge and write one resolved update.
+
+    Returns (FileUpdateInfo, old_content, new_content) on success, None
+    when the merged content is identical to what is already on disk (no
+    write happens), or the raised exception, so one failed file never
+    aborts the rest of a pooled batch. The contents ride along so the
+    caller can stream the diff without this function materializing it.
+    """
+    try:
+        # Read original content; the byte size and mode come back
+        # alongside so no re-encode or extra stat is needed.
+        old_content, old_size, old_mode = _read_text_and_size(file_path)
+
+        # Preserve imports if needed
+        new_content = preserve_imports(old_content, code_block)
+
+        # Identical content needs no write at all — skip the encode, the
+        # temp file, the rename and the directory update. Both strings
+        # are already in memory, so this is one C-level comparison.
+        if new_content == old_content:
+            return None
+
+        # Encode once: the bytes serve both the size metric and the write,
+        # instead of a throwaway encode here and a second one inside
+        # TextIOWrapper at write time.
+        new_bytes = new_content.encode('utf-8')
+
+        # Calculate metrics. Counting newlines directly sidesteps the
+        # full line-list allocation splitlines would make per file, and
+        # the read/write buffers already carry both sizes.
+        new_size = len(new_bytes)
+        old_lines = old_content.count('\n') + (not old_content.endswith('\n') if old_content else 0)
+        new_lines = new_content.count('\n') + (not new_content.endswith('\n') if new_content else 0)
+        percent_change = (new_size / old_size * 100) if old_size > 0 else 100
+
+        update_info = FileUpdateInfo(
+            old_path=file_path,
+            new_path=file_path,
+            old_size=old_size,
+            new_size=new_size,
+            old_lines=old_lines,
+            new_lines=new_lines,
+            percent_change=percent_change
+        )
+
+        # Write to a sibling temp file and rename over the original:
+        # os.replace is atomic on POSIX, so a crash mid-write leaves the
+        # old file intact instead of a truncated hybrid. Raw fd calls
+        # put the whole buffer down in one write syscall, with no
+        # BufferedWriter layer in between.
+        tmp_path = f"{file_path}.tmp.{os.getpid()}"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(new_bytes)
+                while view:
+                    view = view[os.write(fd, view):]
+                # The rename swaps inodes, so the original's permissions
+                # (exec bits, restrictive modes) must be copied across.
+                os.fchmod(fd, old_mode)
+                if _FSYNC_WRITES:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return update_info, old_content, new_content
+    except Exception as e:
+        return e
 
-def update_files(mapped_updates: List[Tuple[str, str]], project_root: str) -> Dict:
+def update_files(mapped_updates: List[Tuple[str, str]], project_root: str,
+                 file_index: Optional[Dict[str, str]] = None) -> Dict:
     """
     Updates files with their corresponding code blocks, preserving imports when needed
     and providing detailed update information.
@@ -152,6 +489,8 @@ def update_files(mapped_updates: List[Tuple[str, str]], project_root: str) -> Di
         mapped_updates (List[Tuple[str, str]]): List of tuples containing filenames 
             and their updated code content
         project_root (str): Root directory of the project
+        file_index (Optional[Dict[str, str]]): Pre-built basename index
+            (see index_from_paths); when given, the tree is not re-walked
         
     Returns:
         Dict: Statistics and detailed information about the update process
@@ -163,74 +502,85 @@ def update_files(mapped_updates: List[Tuple[str, str]], project_root: str) -> Di
     processed_files = set()
     update_details = []
 
+    # Index the project tree once so each update resolves in O(1) instead
+    # of re-walking the whole tree per filename — unless the caller
+    # already walked it and handed us the index.
+    if file_index is None:
+        file_index = _build_file_index(project_root)
+
+    # Resolve paths and deduplicate serially so first-occurrence-wins
+    # stays deterministic, then hand the independent read/merge/write
+    # work to a thread pool; the GIL is released during the file I/O.
+    # Precomputed prefix: both sides are normalized, so concatenation
+    # replaces os.path.join's per-call segment scanning in the loop.
+    root_prefix = os.fspath(project_root).rstrip(os.sep) + os.sep
+    pending = []
     for filename, code_block in mapped_updates:
-        try:
-            # Search for the file in the project directory
-            file_path = find_file(project_root, filename)
-            
-            if not file_path:
-                logger.warning(f"File '{filename}' not found in project directory")
-                unmatched_files.append(filename)
+        # Search for the file in the project directory
+        if filename == '__init__.py' or '/' in filename or '\\' in filename:
+            full_path = root_prefix + filename
+            file_path = full_path if os.path.exists(full_path) else ""
+        else:
+            # No separators in this branch, so the name is its own
+            # basename.
+            file_path = _index_lookup(file_index, filename)
+
+        if not file_path:
+            logger.warning(f"File '{filename}' not found in project directory")
+            unmatched_files.append(filename)
+            files_skipped += 1
+            continue
+
+        # Skip if this file has already been processed
+        if file_path in processed_files:
+            logger.warning(f"Duplicate update attempt for '{file_path}'. Using first occurrence only.")
+            files_skipped += 1
+            continue
+
+        processed_files.add(file_path)
+        pending.append((filename, file_path, code_block))
+
+    # I/O-bound workers oversubscribe cores well; same sizing as the
+    # index walker above.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for filename, outcome in executor.map(
+            lambda item: (item[0], _apply_update(item[1], item[2])), pending
+        ):
+            if isinstance(outcome, Exception):
+                error_msg = f"Error updating '{filename}': {str(outcome)}"
+                logger.error(error_msg)
+                errors[filename] = str(outcome)
                 files_skipped += 1
                 continue
-                
-            # Skip if this file has already been processed
-            if file_path in processed_files:
-                logger.warning(f"Duplicate update attempt for '{file_path}'. Using first occurrence only.")
+
+            if outcome is None:
+                logger.info(f"'{filename}' already up to date; write skipped")
                 files_skipped += 1
                 continue
-                
-            # Read original content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                old_content = f.read()
-                
-            # Preserve imports if needed
-            new_content = preserve_imports(old_content, code_block)
-            
-            # Calculate metrics
-            old_size = len(old_content.encode('utf-8'))
-            new_size = len(new_content.encode('utf-8'))
-            old_lines = len(old_content.splitlines())
-            new_lines = len(new_content.splitlines())
-            percent_change = (new_size / old_size * 100) if old_size > 0 else 100
-            
-            # Create diff
-            diff_content = create_diff(old_content, new_content)
-            
-            # Store update info
-            update_info = FileUpdateInfo(
-                old_path=file_path,
-                new_path=file_path,
-                old_size=old_size,
-                new_size=new_size,
-                old_lines=old_lines,
-                new_lines=new_lines,
-                percent_change=percent_change,
-                diff=diff_content
-            )
+
+            update_info, old_content, new_content = outcome
             update_details.append(update_info)
-            
-            # Write updated content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-                
             files_updated += 1
-            processed_files.add(file_path)
-            
-            # Log detailed update information
-            print(f"\nFile: {file_path}")
-            print(f"Lines: {old_lines} -> {new_lines}")
-            print(f"Size: {old_size/1024:.1f}KB -> {new_size/1024:.1f}KB")
-            print(f"Change: {percent_change:.1f}%")
-            print(format_size_bar(percent_change))
-            print("\nDiff:")
-            print(diff_content)
-
-        except Exception as e:
-            error_msg = f"Error updating '{filename}': {str(e)}"
-            logger.error(error_msg)
-            errors[filename] = str(e)
-            files_skipped += 1
+
+            if _EMIT_DIFF:
+                # The file is already updated on disk at this point; the
+                # diff display is cosmetic, so a failure here (encoding
+                # mismatch with the terminal, broken pipe) must not abort
+                # reporting for the rest of the batch.
+                try:
+                    # Log detailed update information
+                    print(f"\nFile: {update_info.old_path}")
+                    print(f"Lines: {update_info.old_lines} -> {update_info.new_lines}")
+                    print(f"Size: {update_info.old_size/1024:.1f}KB -> {update_info.new_size/1024:.1f}KB")
+                    print(f"Change: {update_info.percent_change:.1f}%")
+                    print(format_size_bar(update_info.percent_change))
+                    print("\nDiff:")
+                    # Stream the diff line by line; it is never held as one string.
+                    sys.stdout.writelines(create_diff(old_content, new_content))
+                    print()
+                except Exception as e:
+                    logger.warning(f"Could not display diff for '{filename}': {e}")
 
     # Log summary
     logger.info(f"Update complete: {files_updated} files updated, {files_skipped} files skipped")
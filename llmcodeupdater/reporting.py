@@ -3,6 +3,13 @@ import json
 from datetime import datetime
 from typing import Dict, Any
 
+try:
+    # Optional accelerator: orjson serializes several times faster than
+    # the stdlib walker, which matters once reports carry per-file data.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 class ReportGenerator:
     def __init__(self, report_dir: str):
         """Initialize ReportGenerator with output directory."""
@@ -20,47 +27,52 @@ class ReportGenerator:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_path = os.path.join(self.report_dir, f'update_report_{timestamp}.md')
         
+        # Compose in memory and write once: one buffer flush instead of a
+        # Python-level f.write call (and its bookkeeping) per line.
+        parts = []
+        
+        # Header
+        parts.append("# Code Update Report\n\n")
+        parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"Backup Reference: {backup_timestamp}\n\n")
+        
+        # Update Summary
+        parts.append("## Update Summary\n")
+        if update_summary['files_updated'] == 0 and update_summary['files_skipped'] == 0:
+            parts.append("No files were updated\n")
+        else:
+            parts.append(f"- Files Updated: {update_summary['files_updated']}\n")
+            parts.append(f"- Files Skipped: {update_summary['files_skipped']}\n")
+            parts.append(f"- Error Files: {len(update_summary['error_files'])}\n")
+        
+        # Task Status
+        parts.append("\n## Task Status\n")
+        if task_summary['total'] == 0:
+            parts.append("No tasks were processed\n")
+        else:
+            parts.append(f"- Total Tasks: {task_summary['total']}\n")
+            parts.append(f"- Pending: {task_summary['pending']}\n")
+            parts.append(f"- Updated: {task_summary['updated']}\n")
+            parts.append(f"- Skipped: {task_summary['skipped']}\n")
+            parts.append(f"- Errors: {task_summary['error']}\n")
+        
+        # Test Results
+        parts.append("\n## Test Results\n")
+        status = "✅ All tests passed" if test_results['tests_passed'] else "❌ Some tests failed"
+        parts.append(f"Status: {status}\n")
+        parts.append(f"- Total Tests: {test_results['total_tests']}\n")
+        parts.append(f"- Failed Tests: {test_results['failed_tests']}\n")
+        parts.append("\n### Test Output\n")
+        parts.append(f"```\n{test_results['test_output']}\n```\n")
+        
+        # Error Details
+        if update_summary['error_files']:
+            parts.append("\n## Error Details\n")
+            for file_path, error in update_summary['error_files'].items():
+                parts.append(f"### {file_path}\nError: {error}\n\n")
+        
         with open(report_path, 'w') as f:
-            # Header
-            f.write("# Code Update Report\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Backup Reference: {backup_timestamp}\n\n")
-            
-            # Update Summary
-            f.write("## Update Summary\n")
-            if update_summary['files_updated'] == 0 and update_summary['files_skipped'] == 0:
-                f.write("No files were updated\n")
-            else:
-                f.write(f"- Files Updated: {update_summary['files_updated']}\n")
-                f.write(f"- Files Skipped: {update_summary['files_skipped']}\n")
-                f.write(f"- Error Files: {len(update_summary['error_files'])}\n")
-            
-            # Task Status
-            f.write("\n## Task Status\n")
-            if task_summary['total'] == 0:
-                f.write("No tasks were processed\n")
-            else:
-                f.write(f"- Total Tasks: {task_summary['total']}\n")
-                f.write(f"- Pending: {task_summary['pending']}\n")
-                f.write(f"- Updated: {task_summary['updated']}\n")
-                f.write(f"- Skipped: {task_summary['skipped']}\n")
-                f.write(f"- Errors: {task_summary['error']}\n")
-            
-            # Test Results
-            f.write("\n## Test Results\n")
-            status = "✅ All tests passed" if test_results['tests_passed'] else "❌ Some tests failed"
-            f.write(f"Status: {status}\n")
-            f.write(f"- Total Tests: {test_results['total_tests']}\n")
-            f.write(f"- Failed Tests: {test_results['failed_tests']}\n")
-            f.write("\n### Test Output\n")
-            f.write(f"```\n{test_results['test_output']}\n```\n")
-            
-            # Error Details
-            if update_summary['error_files']:
-                f.write("\n## Error Details\n")
-                for file_path, error in update_summary['error_files'].items():
-                    f.write(f"### {file_path}\n")
-                    f.write(f"Error: {error}\n\n")
+            f.write(''.join(parts))
         
         return report_path
 
@@ -83,8 +95,12 @@ class ReportGenerator:
             'test_results': test_results
         }
         
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        if _orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(_orjson.dumps(report_data, option=_orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(report_data, f, indent=2)
         
         return report_path
 
@@ -93,17 +109,18 @@ class ReportGenerator:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_path = os.path.join(self.report_dir, f'error_report_{timestamp}.txt')
         
+        # Same single-write composition as the markdown report; the
+        # per-error loop is where call overhead would otherwise add up.
+        parts = ["Code Update Error Report\n", "=" * 50 + "\n\n"]
+        if not error_files:
+            parts.append("No errors were encountered during the update process.\n")
+        else:
+            parts.append(f"Total Errors: {len(error_files)}\n\n")
+            divider = "-" * 50 + "\n"
+            for file_path, error in error_files.items():
+                parts.append(f"File: {file_path}\nError: {error}\n{divider}")
+        
         with open(report_path, 'w') as f:
-            f.write("Code Update Error Report\n")
-            f.write("=" * 50 + "\n\n")
-            
-            if not error_files:
-                f.write("No errors were encountered during the update process.\n")
-            else:
-                f.write(f"Total Errors: {len(error_files)}\n\n")
-                for file_path, error in error_files.items():
-                    f.write(f"File: {file_path}\n")
-                    f.write(f"Error: {error}\n")
-                    f.write("-" * 50 + "\n")
+            f.write(''.join(parts))
         
         return report_path
@@ -1,5 +1,126 @@
-from typing import Dict
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Tuple
+import hashlib
 import os
+import subprocess
+import sys
+
+def compare_files(file_a: str, file_b: str) -> bool:
+    """
+    Check whether two files have identical contents.
+
+    Streams both files through hashlib.file_digest (BLAKE2b) rather than
+    loading them into memory; the hash runs in C and releases the GIL.
+    A 16-byte digest is ample for equality checks, and unbuffered opens
+    let file_digest read straight into its own buffer with no double
+    buffering.
+
+    Args:
+        file_a (str): Path to the first file.
+        file_b (str): Path to the second file.
+
+    Returns:
+        bool: True if both files have the same contents.
+    """
+    digest = lambda: hashlib.blake2b(digest_size=16)
+    with open(file_a, 'rb', buffering=0) as fa, open(file_b, 'rb', buffering=0) as fb:
+        return hashlib.file_digest(fa, digest).digest() == hashlib.file_digest(fb, digest).digest()
+
+def _walk_rel(base: str):
+    """
+    Yield (DirEntry, path relative to base) for every file under base.
+
+    Carrying the relative path along with the scandir stack avoids the
+    per-file os.path.relpath reconstruction an os.walk loop needs, and
+    DirEntry answers the type checks without extra stat calls.
+    """
+    stack = [(base, '')]
+    while stack:
+        directory, rel = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, entry_rel))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry, entry_rel
+
+def validate_updates(backup_dir: str, project_root: str) -> Dict[str, list]:
+    """
+    Compare a backup snapshot against the current project tree.
+
+    Args:
+        backup_dir (str): Root of the timestamped backup snapshot.
+        project_root (str): Root directory of the project.
+
+    Returns:
+        Dict[str, list]: Lists of 'changed_files', 'unchanged_files' and
+        'missing_files', all as paths relative to the backup root.
+    """
+    def check(entry, relative_path):
+        project_path = os.path.join(project_root, relative_path)
+        try:
+            project_st = os.stat(project_path)
+        except OSError:
+            return 'missing_files', relative_path
+        # Different sizes means changed without reading a byte; after an
+        # LLM rewrite that covers most files. The DirEntry stat is free,
+        # already cached from the directory read.
+        if entry.stat(follow_symlinks=False).st_size != project_st.st_size:
+            return 'changed_files', relative_path
+        if compare_files(entry.path, project_path):
+            return 'unchanged_files', relative_path
+        return 'changed_files', relative_path
+
+    results = {'changed_files': [], 'unchanged_files': [], 'missing_files': []}
+    # Stat and hash checks are independent per file; run them on a pool,
+    # but submit through a sliding window so at most a few batches of
+    # futures (not the whole tree) are in flight at once.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    pairs = _walk_rel(backup_dir)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(check, e, rel) for e, rel in islice(pairs, max_workers * 4)}
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                category, relative_path = future.result()
+                results[category].append(relative_path)
+            futures.update(executor.submit(check, e, rel) for e, rel in islice(pairs, len(done)))
+    return results
+
+def run_unit_tests(project_root: str, tail_lines: int = 500) -> Tuple[bool, str]:
+    """
+    Run the project's test suite and capture a bounded tail of its output.
+
+    Streams the runner's stdout line by line into a fixed-size deque
+    instead of buffering everything with capture_output, so memory stays
+    bounded no matter how verbose the suite is.
+
+    Args:
+        project_root (str): Directory to run the tests from.
+        tail_lines (int): Maximum number of trailing output lines to keep.
+
+    Returns:
+        Tuple[bool, str]: Whether the suite passed, and the output tail.
+    """
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'pytest'],
+        cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    tail = deque(maxlen=tail_lines)
+    with process.stdout:
+        for line in process.stdout:
+            tail.append(line)
+    return process.wait() == 0, ''.join(tail)
 
 def generate_report(validation_results: dict, backup_timestamp: str, target_path: str, report_path: str) -> str:
     try:
@@ -1,11 +1,12 @@
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 import logging
 from llmcodeupdater.input_handler import InputHandler, setup_cli_parser
 from llmcodeupdater.task_tracking import TaskTracker
 from llmcodeupdater.code_parser import parse_code_blocks_with_logging
-from llmcodeupdater.mapping import update_files
-from llmcodeupdater.backup import backup_files
+from llmcodeupdater.mapping import update_files, index_from_paths
+from llmcodeupdater.backup import backup_files, latest_backup_timestamp
 from llmcodeupdater.reporting import ReportGenerator
 from llmcodeupdater.file_encoding_handler import FileEncodingHandler
 from llmcodeupdater.ignore_handler import IgnoreHandler  # Import IgnoreHandler
@@ -37,18 +38,45 @@ def setup_project_directories(project_root: str) -> tuple:
     return backup_root, report_dir, db_path
 
 def collect_python_files(project_root: str, ignore_handler: IgnoreHandler) -> list:
-    """Collect all Python files in the project, respecting ignore patterns."""
+    """Collect all Python files in the project, respecting ignore patterns.
+
+    Walks with os.scandir so directory entries answer is_dir/is_file
+    without a stat each, and prunes ignored directories before descending
+    instead of filtering their contents afterwards. Subdirectories are
+    scanned concurrently — scandir releases the GIL, and on network
+    filesystems each directory read is a round trip that overlaps well.
+    """
+    def scan(directory: str):
+        files = []
+        subdirs = []
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return files, subdirs
+        with entries:
+            for entry in entries:
+                if ignore_handler.is_ignored(os.path.relpath(entry.path, project_root)):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.py'):
+                    files.append(entry.path)
+        return files, subdirs
+
     py_files = []
-    for root, _, files in os.walk(project_root):
-        rel_root = os.path.relpath(root, project_root)
-        if ignore_handler.is_ignored(rel_root):
-            continue
-        for file in files:
-            file_rel_path = os.path.join(rel_root, file)
-            if ignore_handler.is_ignored(file_rel_path):
-                continue
-            if file.endswith('.py'):
-                py_files.append(os.path.join(root, file))
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan, project_root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                py_files.extend(files)
+                pending.update(executor.submit(scan, d) for d in subdirs)
+    # Thread-completion order is nondeterministic; sort so downstream
+    # first-occurrence-wins consumers (index_from_paths resolving
+    # duplicate basenames) behave the same on every run.
+    py_files.sort()
     return py_files
 
 def main():
@@ -83,34 +111,50 @@ def main():
         task_tracker = TaskTracker(db_path)
         report_generator = ReportGenerator(report_dir)
         
+        # Walk the tree once; preprocessing and backup below reuse the
+        # same list instead of each re-traversing the project.
+        py_files = collect_python_files(project_root, ignore_handler)
+
         # Preprocess files
         file_handler = FileEncodingHandler()
-        preprocess_results = file_handler.preprocess_files(project_root, backup_dir=backup_root)
+        preprocess_results = file_handler.preprocess_files(
+            project_root, backup_dir=backup_root, ignore_handler=ignore_handler, file_paths=py_files
+        )
         if preprocess_results['failed']:
             for fail in preprocess_results['failed']:
                 logger.error(f"Failed to convert encoding: {fail['path']}, Error: {fail['error']}")
-        
-        # Collect and backup files
-        py_files = collect_python_files(project_root, ignore_handler)
+
         # Convert PosixPath to string before passing to add_tasks
         task_tracker.add_tasks([str(os.path.basename(f)) for f in py_files], str(project_root))
         
         backup_timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        files_backed_up = backup_files(py_files, project_root, backup_root)
+        # Backup is disk-bound and parsing is CPU-bound on the LLM text;
+        # run the backup in the background and parse while it copies. The
+        # result() call below ensures every file is safely backed up
+        # before any update is written.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            backup_future = executor.submit(backup_files, py_files, project_root, backup_root)
+            code_blocks = parse_code_blocks_with_logging(llm_content)
+            files_backed_up = backup_future.result()
         logger.info(f"Backed up {files_backed_up} files.")
-        
-        # Parse and validate code blocks
-        code_blocks = parse_code_blocks_with_logging(llm_content)
+        # Report the snapshot backup_files actually created, falling back
+        # to the pre-computed stamp if none was written.
+        backup_timestamp = latest_backup_timestamp(backup_root) or backup_timestamp
+
+        # Validate code blocks
         if not code_blocks:
             logger.error("No valid code blocks found in LLM output")
             raise ValueError("No valid code blocks to process")
         
-        # Process updates
-        update_result = update_files(code_blocks, project_root)
+        # Process updates, resolving filenames against the files already
+        # collected above instead of walking the tree a second time.
+        update_result = update_files(code_blocks, project_root, file_index=index_from_paths(py_files))
         
-        # Update task statuses
-        for filename, _ in code_blocks:
-            task_tracker.update_task_status(filename, 'updated')
+        # Update task statuses in one batched transaction. Dedupe through
+        # a set first: the LLM output often repeats a filename, and each
+        # duplicate would otherwise cost a redundant UPDATE.
+        updated_filenames = {filename for filename, _ in code_blocks}
+        task_tracker.update_task_statuses([(filename, 'updated') for filename in updated_filenames])
         
         # Generate reports
         update_summary = {
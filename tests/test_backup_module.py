@@ -85,6 +85,19 @@ class TestBackupModuleWithErrorHandling(unittest.TestCase):
         count = backup_files(self.file_paths, self.project_root, self.backup_root)
         self.assertEqual(count, 2)
 
+    def test_backup_is_hardlinked_on_same_device(self):
+        backup_files(self.file_paths, self.project_root, self.backup_root)
+
+        backup_timestamp = os.listdir(self.backup_root)[0]
+        original_file = self.file_paths[0]
+        relative_path = os.path.relpath(original_file, self.project_root)
+        backup_file = os.path.join(self.backup_root, backup_timestamp, relative_path)
+
+        orig_stat = os.stat(original_file)
+        backup_stat = os.stat(backup_file)
+        if orig_stat.st_dev == backup_stat.st_dev:
+            self.assertEqual(orig_stat.st_ino, backup_stat.st_ino)
+
     def test_cleanup_on_failure(self):
         os.chmod(self.backup_root, 0o400)
 
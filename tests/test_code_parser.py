@@ -153,6 +153,26 @@ class TestCodeParserEdgeCases:
         assert len(blocks['update']) == 0
         assert len(blocks['manual_update']) == 0
 
+    def test_format_blocks_for_clipboard(self):
+        """Test that many blocks join into one separator-delimited payload"""
+        from llmcodeupdater.code_block import CodeBlock as ClipboardBlock
+        from llmcodeupdater.code_block import format_blocks_for_clipboard
+
+        def make_block(filename, content):
+            return ClipboardBlock(
+                filename=filename, content=content, is_complete=True,
+                line_number=1, context_before='', context_after='',
+                has_imports=False, line_count=1,
+            )
+
+        blocks = [make_block("one.py", "def first(): pass"),
+                  make_block("two.py", "def second(): pass")]
+        payload = format_blocks_for_clipboard(blocks)
+
+        assert blocks[0].to_clipboard_format() in payload
+        assert blocks[1].to_clipboard_format() in payload
+        assert payload.count("// " + "=" * 70) == 1
+
     def test_legacy_wrapper_compatibility(self):
         """Test that legacy wrapper maintains backward compatibility"""
         content = dedent("""
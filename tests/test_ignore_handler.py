@@ -29,17 +29,12 @@ class TestIgnoreHandler(unittest.TestCase):
     def test_pattern_caching(self):
         """Test that pattern matching uses cache effectively."""
         # First check should cache the result
-        start_time = time.time()
         result1 = self.handler.is_ignored('some/long/path/file.pyc')
-        first_check_time = time.time() - start_time
-        
-        # Second check should be faster due to cache
-        start_time = time.time()
+        self.assertIn('some/long/path/file.pyc', self.handler._pattern_cache)
+
+        # Second check should hit the cache and agree with the first
         result2 = self.handler.is_ignored('some/long/path/file.pyc')
-        second_check_time = time.time() - start_time
-        
         self.assertEqual(result1, result2)
-        self.assertLess(second_check_time, first_check_time)
 
     def tearDown(self):
         # Clean up test directory
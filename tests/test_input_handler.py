@@ -34,29 +34,22 @@ class TestInputHandler(unittest.TestCase):
             import shutil
             shutil.rmtree(self.temp_dir)
 
-    @patch('pathlib.Path.iterdir')
-    def test_get_git_projects(self, mock_iterdir):
+    @patch('llmcodeupdater.input_handler.os.path.exists', return_value=True)
+    @patch('llmcodeupdater.input_handler.os.scandir')
+    def test_get_git_projects(self, mock_scandir, mock_exists):
         # Mock directory with git projects
         mock_projects = [
-            MagicMock(
-                is_dir=MagicMock(return_value=True),
-                __str__=MagicMock(return_value='/path/to/project1'),
-                __truediv__=MagicMock(return_value=MagicMock(exists=MagicMock(return_value=True)))
-            ),
-            MagicMock(
-                is_dir=MagicMock(return_value=True),
-                __str__=MagicMock(return_value='/path/to/project2'),
-                __truediv__=MagicMock(return_value=MagicMock(exists=MagicMock(return_value=True)))
-            )
+            MagicMock(path='/path/to/project1', is_dir=MagicMock(return_value=True)),
+            MagicMock(path='/path/to/project2', is_dir=MagicMock(return_value=True))
         ]
-        mock_iterdir.return_value = mock_projects
-        
+        mock_scandir.return_value.__enter__.return_value = mock_projects
+
         projects = self.handler.get_git_projects()
         self.assertEqual(len(projects), 2)
         self.assertIn('/path/to/project1', projects)
         self.assertIn('/path/to/project2', projects)
 
-    @patch('llmcodeupdater.input_handler.inquirer.prompt')
+    @patch('inquirer.prompt')
     @patch('llmcodeupdater.input_handler.InputHandler.get_git_projects')
     def test_select_project_interactive(self, mock_get_projects, mock_prompt):
         # Setup mock projects
@@ -69,20 +62,20 @@ class TestInputHandler(unittest.TestCase):
         project = self.handler.select_project_interactive()
         self.assertEqual(project, '/path/to/project1')
 
-    @patch('llmcodeupdater.input_handler.inquirer.prompt')
+    @patch('inquirer.prompt')
     def test_select_project_interactive_empty(self, mock_prompt):
         # Simulate no project selected
         mock_prompt.return_value = None
         project = self.handler.select_project_interactive()
         self.assertIsNone(project)
 
-    @patch('llmcodeupdater.input_handler.pyperclip.paste')
+    @patch('pyperclip.paste')
     def test_get_clipboard_content_success(self, mock_paste):
         mock_paste.return_value = "Sample clipboard content"
         content = self.handler.get_clipboard_content()
         self.assertEqual(content, "Sample clipboard content")
 
-    @patch('llmcodeupdater.input_handler.pyperclip.paste', side_effect=Exception("Clipboard error"))
+    @patch('pyperclip.paste', side_effect=Exception("Clipboard error"))
     def test_get_clipboard_content_failure(self, mock_paste):
         content = self.handler.get_clipboard_content()
         self.assertIsNone(content)
@@ -122,7 +115,7 @@ class TestInputHandler(unittest.TestCase):
         result = self.handler.process_input(args)
         self.assertEqual(result['llm_content'], 'Sample content')
 
-    @patch('llmcodeupdater.input_handler.pyperclip.paste')
+    @patch('pyperclip.paste')
     def test_process_input_clipboard(self, mock_paste):
         mock_paste.return_value = 'Clipboard content'
         args = {'use_clipboard': True}
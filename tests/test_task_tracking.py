@@ -4,6 +4,7 @@ import unittest
 import os
 import tempfile
 import sqlite3
+import shutil
 import time
 from datetime import datetime, timedelta
 from llmcodeupdater.task_tracking import TaskTracker
@@ -16,9 +17,8 @@ class TestTaskTracker(unittest.TestCase):
         self.tracker = TaskTracker(self.db_path)
 
     def tearDown(self):
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        # Remove the db plus any WAL sidecar files (-wal/-shm)
+        shutil.rmtree(self.temp_dir)
 
     def test_clear_project_tasks(self):
         """Test clearing tasks for a specific project."""
@@ -103,6 +103,43 @@ class TestTaskTracker(unittest.TestCase):
         self.assertAlmostEqual(perf['max_processing_time'], 2.0)
         self.assertAlmostEqual(perf['total_processing_time'], 3.5)
 
+    def test_batch_groups_updates_into_one_transaction(self):
+        """Test that updates inside batch() all land at block exit."""
+        files = ['/path/to/file1.py', '/path/to/file2.py']
+        self.tracker.add_tasks(files, self.project_path)
+
+        with self.tracker.batch():
+            self.tracker.update_task_status(files[0], 'updated', processing_time=1.0)
+            self.tracker.update_task_status(files[1], 'skipped', processing_time=0.5)
+
+        summary = self.tracker.get_task_summary(self.project_path)
+        self.assertEqual(summary['updated'], 1)
+        self.assertEqual(summary['skipped'], 1)
+        self.assertEqual(summary['pending'], 0)
+
+    def test_update_task_statuses_short_and_full_tuples(self):
+        """Test bulk updates with both (path, status) and 4-tuple forms."""
+        files = ['/path/to/file1.py', '/path/to/file2.py']
+        self.tracker.add_tasks(files, self.project_path)
+
+        self.tracker.update_task_statuses([
+            (files[0], 'updated'),
+            (files[1], 'error', 'Test error', 2.0),
+        ])
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT status, error_message, processing_time FROM tasks WHERE file_path = ?",
+                (files[0],)
+            )
+            self.assertEqual(cursor.fetchone(), ('updated', None, 0.0))
+            cursor.execute(
+                "SELECT status, error_message, processing_time FROM tasks WHERE file_path = ?",
+                (files[1],)
+            )
+            self.assertEqual(cursor.fetchone(), ('error', 'Test error', 2.0))
+
     def test_cleanup_old_tasks(self):
         """Test cleaning up old tasks."""
         # Add some tasks
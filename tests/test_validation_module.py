@@ -1,6 +1,8 @@
 import unittest
 import os
-from llmcodeupdater.validation import generate_report
+import shutil
+import tempfile
+from llmcodeupdater.validation import compare_files, generate_report, run_unit_tests, validate_updates
 
 class TestReportingModuleExtended(unittest.TestCase):
     def setUp(self):
@@ -56,4 +58,55 @@ class TestReportingModuleExtended(unittest.TestCase):
         with self.assertRaises(OSError, msg="Expected OSError due to invalid file path"):
             generate_report(self.validation_results, self.backup_timestamp, self.target_path, invalid_report_path)
 
+class TestValidationFunctions(unittest.TestCase):
+    def setUp(self):
+        self.backup_dir = tempfile.mkdtemp()
+        self.project_root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.backup_dir)
+        shutil.rmtree(self.project_root)
+
+    def _write(self, root, relative_path, content):
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_compare_files_identical(self):
+        file_a = self._write(self.project_root, 'a.py', '# same content\n')
+        file_b = self._write(self.project_root, 'b.py', '# same content\n')
+        self.assertTrue(compare_files(file_a, file_b))
+
+    def test_compare_files_different(self):
+        file_a = self._write(self.project_root, 'a.py', '# content one\n')
+        file_b = self._write(self.project_root, 'b.py', '# content two\n')
+        self.assertFalse(compare_files(file_a, file_b))
+
+    def test_validate_updates_categorizes_files(self):
+        self._write(self.backup_dir, 'same.py', '# unchanged\n')
+        self._write(self.project_root, 'same.py', '# unchanged\n')
+        self._write(self.backup_dir, os.path.join('sub', 'diff.py'), '# old\n')
+        self._write(self.project_root, os.path.join('sub', 'diff.py'), '# new\n')
+        self._write(self.backup_dir, 'gone.py', '# deleted\n')
+
+        results = validate_updates(self.backup_dir, self.project_root)
+
+        self.assertEqual(results['unchanged_files'], ['same.py'])
+        self.assertEqual(results['changed_files'], [os.path.join('sub', 'diff.py')])
+        self.assertEqual(results['missing_files'], ['gone.py'])
+
+    def test_run_unit_tests_passing_suite(self):
+        self._write(self.project_root, 'test_ok.py', 'def test_ok():\n    assert True\n')
+        passed, output = run_unit_tests(self.project_root)
+        self.assertTrue(passed)
+        self.assertIn('1 passed', output)
+
+    def test_run_unit_tests_failing_suite(self):
+        self._write(self.project_root, 'test_bad.py', 'def test_bad():\n    assert False\n')
+        passed, output = run_unit_tests(self.project_root)
+        self.assertFalse(passed)
+        self.assertIn('1 failed', output)
+
 unittest.TextTestRunner().run(unittest.makeSuite(TestReportingModuleExtended))